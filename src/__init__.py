@@ -1,5 +1,16 @@
 
 import bpy
+import concurrent.futures
+import importlib.util
+import multiprocessing
+import numpy as np
+import os
+import struct
+import sys
+import time
+from bpy.app.handlers import persistent
+from bpy_extras.io_utils import ImportHelper
+from concurrent.futures.process import BrokenProcessPool
 from math import degrees, radians, acos
 from mathutils import Euler, Matrix, Vector, Quaternion
 
@@ -37,9 +48,338 @@ class QuaternionProceduralProperty(bpy.types.PropertyGroup):
     preview: bpy.props.BoolProperty()
 
 
+jiggle_bone_caches = {}
+jiggle_bone_generations = {}
+
+
+def clear_jiggle_bone_cache(armature_name):
+    jiggle_bone_caches.pop(armature_name, None)
+    jiggle_bone_generations[armature_name] = jiggle_bone_generations.get(armature_name, 0) + 1
+
+
+def invalidate_jiggle_bone_cache(self, context):
+    clear_jiggle_bone_cache(self.id_data.name)
+
+
+class JiggleBoneProperty(bpy.types.PropertyGroup):
+    name: bpy.props.StringProperty(default="New Jiggle Bone")
+    bone: bpy.props.StringProperty(update=invalidate_jiggle_bone_cache)
+    length: bpy.props.FloatProperty(default=10, min=0.001, soft_max=100, update=invalidate_jiggle_bone_cache)
+    tip_mass: bpy.props.FloatProperty(default=0, min=0, soft_max=1000, update=invalidate_jiggle_bone_cache)
+    yaw_stiffness: bpy.props.FloatProperty(default=100, min=0, soft_max=1000, update=invalidate_jiggle_bone_cache)
+    yaw_damping: bpy.props.FloatProperty(default=7, min=0, soft_max=100, update=invalidate_jiggle_bone_cache)
+    pitch_stiffness: bpy.props.FloatProperty(default=100, min=0, soft_max=1000, update=invalidate_jiggle_bone_cache)
+    pitch_damping: bpy.props.FloatProperty(default=7, min=0, soft_max=100, update=invalidate_jiggle_bone_cache)
+    yaw_constraint: bpy.props.BoolProperty(default=False, update=invalidate_jiggle_bone_cache)
+    yaw_limits: bpy.props.FloatVectorProperty(size=2, default=(radians(-30), radians(30)), min=radians(-89), max=radians(89),
+                                              precision=6, unit='ROTATION', update=invalidate_jiggle_bone_cache)
+    pitch_constraint: bpy.props.BoolProperty(default=False, update=invalidate_jiggle_bone_cache)
+    pitch_limits: bpy.props.FloatVectorProperty(size=2, default=(radians(-30), radians(30)), min=radians(-89), max=radians(89),
+                                                precision=6, unit='ROTATION', update=invalidate_jiggle_bone_cache)
+
+
 class SourceProceduralBoneDataProperty(bpy.types.PropertyGroup):
     quaternion_procedurals: bpy.props.CollectionProperty(type=QuaternionProceduralProperty)
     active_quaternion_procedural: bpy.props.IntProperty()
+    jiggle_bones: bpy.props.CollectionProperty(type=JiggleBoneProperty)
+    active_jiggle_bone: bpy.props.IntProperty()
+    jiggle_substeps: bpy.props.IntProperty(default=4, min=1, soft_max=16, update=invalidate_jiggle_bone_cache)
+    jiggle_preview: bpy.props.BoolProperty()
+
+# endregion
+
+# region Helpers
+
+
+def get_string_after_dot(input_string):
+    parts = input_string.split('.', 1)
+    if len(parts) > 1:
+        return parts[1]
+    return input_string
+
+
+def get_quaternion_procedural_string(armature, quaternion_procedural):
+    target_bone = armature.pose.bones[quaternion_procedural.target_bone]
+    control_bone = armature.pose.bones[quaternion_procedural.control_bone]
+
+    current_position = (target_bone.parent.bone.matrix_local.inverted_safe() @ target_bone.bone.matrix_local).to_translation()
+
+    if quaternion_procedural.override_position:
+        current_position = Vector(quaternion_procedural.position_override)
+
+    procedural_string = ""
+
+    procedural_string += "<helper> " + get_string_after_dot(target_bone.name) + " " + \
+        get_string_after_dot(target_bone.parent.name) + " " + \
+        get_string_after_dot(control_bone.parent.name) + " " + \
+        get_string_after_dot(control_bone.name) + "\n"
+
+    procedural_string += "<display> 0 0 0 " + str(quaternion_procedural.distance if quaternion_procedural.override_position else 0) + "\n"
+
+    procedural_string += "<basepos> " + str(current_position.x) + " " + str(current_position.y) + " " + str(current_position.z) + "\n"
+
+    procedural_string += "<rotateaxis> 0 0 0\n"
+
+    procedural_string += "<jointorient> 0 0 0\n"
+
+    for trigger in quaternion_procedural.triggers:
+        procedural_string += "<trigger> " + str(degrees(trigger.tolerance)) + " " + \
+            " ".join([str(degrees(r)) for r in trigger.trigger_angle]) + " " + \
+            " ".join([str(degrees(r)) for r in trigger.target_angle]) + " " + \
+            " ".join([str(p) for p in trigger.target_position]) + "\n"
+
+    return procedural_string
+
+
+def is_quaternion_procedural_valid(armature, quaternion_procedural):
+    target_bone = armature.pose.bones.get(quaternion_procedural.target_bone)
+    control_bone = armature.pose.bones.get(quaternion_procedural.control_bone)
+
+    if target_bone is None or control_bone is None or target_bone == control_bone:
+        return False
+
+    if target_bone.parent is None or control_bone.parent is None:
+        return False
+
+    return len(quaternion_procedural.triggers) > 0
+
+# endregion
+
+# region Jobs
+
+
+WORKER_MODULE_NAME = "srcprocbones_worker"
+JOB_TICK_BUDGET = 0.02
+JOB_TIMER_INTERVAL = 0.05
+
+# Worker processes load worker.py under the same top level name, so its functions unpickle without importing bpy.
+WORKER_BOOTSTRAP = (
+    "import importlib.util, sys\n"
+    "spec = importlib.util.spec_from_file_location(name, path)\n"
+    "sys.modules[name] = importlib.util.module_from_spec(spec)\n"
+    "spec.loader.exec_module(sys.modules[name])\n"
+)
+
+
+def load_worker_module():
+    spec = importlib.util.spec_from_file_location(WORKER_MODULE_NAME, os.path.join(os.path.dirname(__file__), "worker.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[WORKER_MODULE_NAME] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+
+worker = load_worker_module()
+worker_pool = None
+procedural_jobs = {}
+
+
+def get_worker_pool():
+    global worker_pool
+
+    if worker_pool is None:
+        worker_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max(1, min(4, (os.cpu_count() or 2) - 1)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=exec,
+            initargs=(WORKER_BOOTSTRAP, {"name": WORKER_MODULE_NAME, "path": worker.__file__}),
+        )
+
+    return worker_pool
+
+
+def shutdown_worker_pool():
+    global worker_pool
+
+    if worker_pool is not None:
+        worker_pool.shutdown(wait=False, cancel_futures=True)
+        worker_pool = None
+
+
+def run_in_worker(function, *args):
+    future = get_worker_pool().submit(function, *args)
+
+    try:
+        while not future.done():
+            yield None
+    finally:
+        future.cancel()
+
+    return future.result()
+
+
+class ProceduralJob:
+    def __init__(self, label):
+        self.label = label
+        self.steps = None
+        self.messages = []
+        self.progress = 0.0
+        self.elapsed = 0.0
+        self.resumed = time.perf_counter()
+        self.paused = False
+        self.pausable = True
+
+    def advance(self):
+        start = time.perf_counter()
+
+        try:
+            while time.perf_counter() - start < JOB_TICK_BUDGET:
+                progress = next(self.steps)
+
+                # Steps yield None while they wait on a worker process, which gives the rest of the tick back to Blender.
+                if progress is None:
+                    break
+
+                self.progress = progress
+        except StopIteration:
+            self.progress = 1.0
+            return True
+
+        return False
+
+    def pause(self):
+        self.elapsed = self.get_elapsed()
+        self.paused = True
+
+    def resume(self):
+        self.resumed = time.perf_counter()
+        self.paused = False
+
+    def cancel(self):
+        self.steps.close()
+
+    def get_elapsed(self):
+        if self.paused:
+            return self.elapsed
+
+        return self.elapsed + time.perf_counter() - self.resumed
+
+    def get_eta(self):
+        if self.progress <= 0:
+            return None
+
+        elapsed = self.get_elapsed()
+
+        return elapsed / self.progress - elapsed
+
+
+def has_procedural_job(context):
+    return context.object is not None and context.object.name in procedural_jobs
+
+
+class ProceduralJobOperator:
+    def __init__(self):
+        self.object_name = None
+        self.job = None
+        self.timer = None
+
+    def run_job(self, context, job, steps=None):
+        if steps is not None:
+            job.steps = steps
+
+        procedural_jobs[context.object.name] = job
+        job.resume()
+
+        self.object_name = context.object.name
+        self.job = job
+        self.timer = context.window_manager.event_timer_add(JOB_TIMER_INTERVAL, window=context.window)
+        context.window_manager.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        job = self.job
+
+        if procedural_jobs.get(self.object_name) is not job or job.paused:
+            self.cancel(context)
+            return {'FINISHED'}
+
+        finished = True
+
+        try:
+            finished = job.advance()
+        except Exception as error:
+            if isinstance(error, BrokenProcessPool):
+                shutdown_worker_pool()
+
+            self.report({'ERROR'}, job.label + " failed: " + str(error))
+            return {'CANCELLED'}
+        finally:
+            if finished:
+                procedural_jobs.pop(self.object_name, None)
+                self.cancel(context)
+
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+
+        if not finished:
+            return {'PASS_THROUGH'}
+
+        for message_type, message in job.messages:
+            self.report({message_type}, message)
+
+        return {'FINISHED'}
+
+    def cancel(self, context):
+        if self.timer is not None:
+            context.window_manager.event_timer_remove(self.timer)
+            self.timer = None
+
+        # Keep a job whose runner was stopped by Blender so it can be resumed.
+        if self.job is not None and procedural_jobs.get(self.object_name) is self.job and not self.job.paused:
+            self.job.pause()
+
+        self.job = None
+
+
+class PauseProceduralJobOperator(bpy.types.Operator):
+    bl_idname = "source_procedural.job_pause"
+    bl_label = "Pause Job"
+    bl_description = "Pauses the running job so it can be resumed later"
+
+    @classmethod
+    def poll(cls, context):
+        procedural_job = procedural_jobs.get(context.object.name) if context.object is not None else None
+
+        return procedural_job is not None and procedural_job.pausable and not procedural_job.paused
+
+    def execute(self, context):
+        procedural_jobs[context.object.name].pause()
+
+        return {'FINISHED'}
+
+
+class ResumeProceduralJobOperator(ProceduralJobOperator, bpy.types.Operator):
+    bl_idname = "source_procedural.job_resume"
+    bl_label = "Resume Job"
+    bl_description = "Resumes the paused job"
+
+    @classmethod
+    def poll(cls, context):
+        return has_procedural_job(context) and procedural_jobs[context.object.name].paused
+
+    def execute(self, context):
+        return self.run_job(context, procedural_jobs[context.object.name])
+
+
+class CancelProceduralJobOperator(bpy.types.Operator):
+    bl_idname = "source_procedural.job_cancel"
+    bl_label = "Cancel Job"
+    bl_description = "Cancels the running or paused job"
+
+    @classmethod
+    def poll(cls, context):
+        return has_procedural_job(context)
+
+    def execute(self, context):
+        procedural_jobs.pop(context.object.name).cancel()
+
+        return {'FINISHED'}
 
 # endregion
 
@@ -270,44 +610,40 @@ class CopyQuaternionProceduralOperator(bpy.types.Operator):
     def execute(self, context):
         source_procedural_bone_data = context.object.source_procedural_bone_data
         active_quaternion_procedural = source_procedural_bone_data.quaternion_procedurals[source_procedural_bone_data.active_quaternion_procedural]
-        target_bone = context.object.pose.bones[active_quaternion_procedural.target_bone]
-        control_bone = context.object.pose.bones[active_quaternion_procedural.control_bone]
+        procedural_string = get_quaternion_procedural_string(context.object, active_quaternion_procedural)
 
-        current_position = (target_bone.parent.bone.matrix_local.inverted_safe() @ target_bone.bone.matrix_local).to_translation()
+        context.window_manager.clipboard = procedural_string
 
-        if active_quaternion_procedural.override_position:
-            current_position = Vector(active_quaternion_procedural.position_override)
+        return {'FINISHED'}
 
-        procedural_string = ""
 
-        def get_string_after_dot(input_string):
-            parts = input_string.split('.', 1)
-            if len(parts) > 1:
-                return parts[1]
-            return input_string
+def copy_quaternion_procedurals(window_manager, armature):
+    quaternion_procedurals = armature.source_procedural_bone_data.quaternion_procedurals
+    procedural_strings = []
 
-        procedural_string += "<helper> " + get_string_after_dot(target_bone.name) + " " + \
-            get_string_after_dot(target_bone.parent.name) + " " + \
-            get_string_after_dot(control_bone.parent.name) + " " + \
-            get_string_after_dot(control_bone.name) + "\n"
+    for index, quaternion_procedural in enumerate(quaternion_procedurals):
+        if is_quaternion_procedural_valid(armature, quaternion_procedural):
+            procedural_strings.append(get_quaternion_procedural_string(armature, quaternion_procedural))
 
-        procedural_string += "<display> 0 0 0 " + str(active_quaternion_procedural.distance if active_quaternion_procedural.override_position else 0) + "\n"
+        yield (index + 1) / len(quaternion_procedurals)
 
-        procedural_string += "<basepos> " + str(current_position.x) + " " + str(current_position.y) + " " + str(current_position.z) + "\n"
+    window_manager.clipboard = "".join(procedural_strings)
 
-        procedural_string += "<rotateaxis> 0 0 0\n"
 
-        procedural_string += "<jointorient> 0 0 0\n"
+class CopyAllQuaternionProceduralsOperator(ProceduralJobOperator, bpy.types.Operator):
+    bl_idname = "source_procedural.quaternion_copy_all"
+    bl_label = "Copy All Quaternion Procedurals"
+    bl_description = "Copies every valid quaternion procedural to the clipboard"
 
-        for trigger in active_quaternion_procedural.triggers:
-            procedural_string += "<trigger> " + str(degrees(trigger.tolerance)) + " " + \
-                " ".join([str(degrees(r)) for r in trigger.trigger_angle]) + " " + \
-                " ".join([str(degrees(r)) for r in trigger.target_angle]) + " " + \
-                " ".join([str(p) for p in trigger.target_position]) + "\n"
+    @classmethod
+    def poll(cls, context):
+        source_procedural_bone_data = context.object.source_procedural_bone_data
 
-        context.window_manager.clipboard = procedural_string
+        return not has_procedural_job(context) and len(source_procedural_bone_data.quaternion_procedurals) > 0
 
-        return {'FINISHED'}
+    def execute(self, context):
+        return self.run_job(context, ProceduralJob("Copying quaternion procedurals"),
+                            copy_quaternion_procedurals(context.window_manager, context.object))
 
 # endregion
 
@@ -521,6 +857,622 @@ class PreviewQuaternionProceduralTriggerOperator(bpy.types.Operator):
 
 # endregion
 
+# region Jiggle Bone Simulation
+
+
+def get_jiggle_bones(armature):
+    pose_bones = armature.pose.bones
+    jiggle_bones = []
+    bone_names = set()
+
+    for jiggle_bone in armature.source_procedural_bone_data.jiggle_bones:
+        if jiggle_bone.bone in bone_names or pose_bones.get(jiggle_bone.bone) is None:
+            continue
+
+        bone_names.add(jiggle_bone.bone)
+        jiggle_bones.append(jiggle_bone)
+
+    return jiggle_bones
+
+
+class JiggleBoneSimulator:
+    def __init__(self, armature):
+        self.armature = armature
+        pose_bones = armature.pose.bones
+        jiggle_bones = get_jiggle_bones(armature)
+        jiggle_bone_names = {jiggle_bone.bone for jiggle_bone in jiggle_bones}
+
+        # Each bone follows its nearest jiggle ancestor, even through bones that do not jiggle.
+        jiggle_parents = {}
+        for jiggle_bone in jiggle_bones:
+            parent = pose_bones[jiggle_bone.bone].parent
+            while parent is not None and parent.name not in jiggle_bone_names:
+                parent = parent.parent
+            jiggle_parents[jiggle_bone.bone] = parent.name if parent is not None else None
+
+        def get_depth(bone_name):
+            depth = 0
+            while jiggle_parents[bone_name] is not None:
+                depth += 1
+                bone_name = jiggle_parents[bone_name]
+            return depth
+
+        depths = [get_depth(jiggle_bone.bone) for jiggle_bone in jiggle_bones]
+
+        # Parents in a jiggle chain are stepped before their children.
+        order = sorted(range(len(jiggle_bones)), key=lambda index: depths[index])
+        jiggle_bones = [jiggle_bones[index] for index in order]
+        depths = np.array([depths[index] for index in order], dtype=int)
+
+        self.bone_names = [jiggle_bone.bone for jiggle_bone in jiggle_bones]
+        self.levels = [np.flatnonzero(depths == depth) for depth in range(depths.max() + 1)] if len(depths) else []
+
+        self.parent_indices = np.full(len(jiggle_bones), -1, dtype=int)
+        self.rest_offsets = []
+        for index, bone_name in enumerate(self.bone_names):
+            pose_bone = pose_bones[bone_name]
+            jiggle_parent = jiggle_parents[bone_name]
+
+            if jiggle_parent is not None:
+                self.parent_indices[index] = self.bone_names.index(jiggle_parent)
+                self.rest_offsets.append(pose_bones[jiggle_parent].bone.matrix_local.inverted_safe() @ pose_bone.bone.matrix_local)
+                continue
+
+            if pose_bone.parent is None:
+                self.rest_offsets.append(pose_bone.bone.matrix_local.copy())
+                continue
+
+            self.rest_offsets.append(pose_bone.parent.bone.matrix_local.inverted_safe() @ pose_bone.bone.matrix_local)
+
+        def parameter(name):
+            return np.array([getattr(jiggle_bone, name) for jiggle_bone in jiggle_bones], dtype=float)
+
+        # An unconstrained axis gets limits that atan2 can never leave.
+        self.parameters = {
+            "levels": self.levels,
+            "parent_indices": self.parent_indices,
+            "rest_offsets": np.array([np.array(rest_offset) for rest_offset in self.rest_offsets]).reshape(-1, 4, 4),
+            "lengths": parameter("length"),
+            "tip_masses": parameter("tip_mass"),
+            "yaw_stiffnesses": parameter("yaw_stiffness"),
+            "yaw_dampings": parameter("yaw_damping"),
+            "pitch_stiffnesses": parameter("pitch_stiffness"),
+            "pitch_dampings": parameter("pitch_damping"),
+            "yaw_minimums": np.array([jiggle_bone.yaw_limits[0] if jiggle_bone.yaw_constraint else -np.pi for jiggle_bone in jiggle_bones]),
+            "yaw_maximums": np.array([jiggle_bone.yaw_limits[1] if jiggle_bone.yaw_constraint else np.pi for jiggle_bone in jiggle_bones]),
+            "pitch_minimums": np.array([jiggle_bone.pitch_limits[0] if jiggle_bone.pitch_constraint else -np.pi for jiggle_bone in jiggle_bones]),
+            "pitch_maximums": np.array([jiggle_bone.pitch_limits[1] if jiggle_bone.pitch_constraint else np.pi for jiggle_bone in jiggle_bones]),
+        }
+
+    def sample_anchors(self, anchors):
+        armature = self.armature
+
+        for index in self.levels[0] if self.levels else []:
+            pose_bone = armature.pose.bones[self.bone_names[index]]
+            parent_matrix = pose_bone.parent.matrix if pose_bone.parent is not None else Matrix.Identity(4)
+            anchors[index] = np.array(armature.matrix_world @ parent_matrix @ self.rest_offsets[index])
+
+
+def simulate_jiggle_bones(scene, armature, job, progress_scale=1.0):
+    simulator = JiggleBoneSimulator(armature)
+    frames = range(scene.frame_start, scene.frame_end + 1)
+    fps = scene.render.fps / scene.render.fps_base
+    substeps = armature.source_procedural_bone_data.jiggle_substeps
+    generation = jiggle_bone_generations.get(armature.name, 0)
+    anchors = np.tile(np.identity(4), (len(frames), len(simulator.bone_names), 1, 1))
+
+    # Sampling moves the timeline, so it is put back before every yield and the job can not pause until it is done.
+    job.pausable = False
+    frame_index = 0
+
+    while frame_index < len(frames):
+        frame_current = scene.frame_current
+        start = time.perf_counter()
+
+        try:
+            while frame_index < len(frames) and time.perf_counter() - start < JOB_TICK_BUDGET:
+                scene.frame_set(frames[frame_index])
+                simulator.sample_anchors(anchors[frame_index])
+                frame_index += 1
+        finally:
+            scene.frame_set(frame_current)
+
+        yield progress_scale * 0.5 * frame_index / len(frames)
+
+    job.pausable = True
+
+    rotations = yield from run_in_worker(worker.integrate_jiggle_bones, simulator.parameters, anchors, 1 / (fps * substeps), substeps)
+
+    if jiggle_bone_generations.get(armature.name, 0) != generation:
+        raise RuntimeError("jiggle bone settings changed while simulating, simulate again")
+
+    jiggle_bone_caches[armature.name] = {
+        "armature_pointer": armature.as_pointer(),
+        "bone_names": simulator.bone_names,
+        "frame_range": (frames.start, frames.stop - 1, fps),
+        "rotations": rotations,
+    }
+
+    apply_jiggle_bone_cache(armature, jiggle_bone_caches[armature.name], scene.frame_current)
+
+    return jiggle_bone_caches[armature.name]
+
+
+def ensure_jiggle_bone_fcurve(armature, action, data_path, index, group_name):
+    if hasattr(action, "fcurve_ensure_for_datablock"):
+        return action.fcurve_ensure_for_datablock(armature, data_path, index=index, group_name=group_name)
+
+    fcurve = action.fcurves.find(data_path, index=index)
+    if fcurve is None:
+        fcurve = action.fcurves.new(data_path, index=index, action_group=group_name)
+
+    return fcurve
+
+
+def bake_jiggle_bones(scene, armature, job):
+    cache = yield from simulate_jiggle_bones(scene, armature, job, 0.5)
+    frame_start = cache["frame_range"][0]
+    frames = np.arange(frame_start, frame_start + len(cache["rotations"]), dtype=float)
+
+    bone_values = []
+
+    for bone_index, bone_name in enumerate(cache["bone_names"]):
+        pose_bone = armature.pose.bones.get(bone_name)
+        if pose_bone is None:
+            continue
+
+        quaternions = cache["rotations"][:, bone_index]
+
+        # Key in the bone's own rotation mode rather than switching it to quaternions.
+        if pose_bone.rotation_mode == 'QUATERNION':
+            data_path = "rotation_quaternion"
+            values = quaternions
+        elif pose_bone.rotation_mode == 'AXIS_ANGLE':
+            data_path = "rotation_axis_angle"
+            values = []
+            for quaternion in quaternions.tolist():
+                axis, angle = Quaternion(quaternion).to_axis_angle()
+                values.append((angle, *axis))
+            values = np.array(values)
+        else:
+            data_path = "rotation_euler"
+            values = []
+            euler = Euler((0, 0, 0), pose_bone.rotation_mode)
+            for quaternion in quaternions.tolist():
+                euler = Quaternion(quaternion).to_euler(pose_bone.rotation_mode, euler)
+                values.append(tuple(euler))
+            values = np.array(values)
+
+        bone_values.append((bone_name, pose_bone.path_from_id(data_path), values))
+
+        yield 0.5 + 0.5 * (bone_index + 1) / len(cache["bone_names"])
+
+    # The action is only written once every value is ready, so a cancelled bake leaves it untouched.
+    if armature.animation_data is None:
+        armature.animation_data_create()
+
+    if armature.animation_data.action is None:
+        armature.animation_data.action = bpy.data.actions.new(armature.name + "Action")
+
+    action = armature.animation_data.action
+
+    for bone_name, data_path, values in bone_values:
+        for index in range(values.shape[1]):
+            fcurve = ensure_jiggle_bone_fcurve(armature, action, data_path, index, bone_name)
+
+            for keyframe_point in reversed(fcurve.keyframe_points):
+                if frames[0] <= keyframe_point.co.x <= frames[-1]:
+                    fcurve.keyframe_points.remove(keyframe_point, fast=True)
+
+            keyframe_count = len(fcurve.keyframe_points)
+            fcurve.keyframe_points.add(len(frames))
+
+            coordinates = np.empty(len(fcurve.keyframe_points) * 2)
+            fcurve.keyframe_points.foreach_get("co", coordinates)
+            coordinates.reshape(-1, 2)[keyframe_count:] = np.stack((frames, values[:, index]), axis=1)
+            fcurve.keyframe_points.foreach_set("co", coordinates)
+            fcurve.update()
+
+    apply_jiggle_bone_cache(armature, cache, scene.frame_current)
+
+
+def get_jiggle_bone_cache(scene, armature):
+    cache = jiggle_bone_caches.get(armature.name)
+    frame_range = (scene.frame_start, scene.frame_end, scene.render.fps / scene.render.fps_base)
+
+    if cache is None or cache["armature_pointer"] != armature.as_pointer() or cache["frame_range"] != frame_range:
+        return None
+
+    return cache
+
+
+def apply_jiggle_bone_cache(armature, cache, frame):
+    rotations = cache["rotations"]
+    frame_index = min(max(frame - cache["frame_range"][0], 0), len(rotations) - 1)
+
+    for bone_name, rotation in zip(cache["bone_names"], rotations[frame_index]):
+        pose_bone = armature.pose.bones.get(bone_name)
+        if pose_bone is None:
+            continue
+
+        location, _, scale = pose_bone.matrix_basis.decompose()
+        pose_bone.matrix_basis = Matrix.LocRotScale(location, Quaternion(rotation.tolist()), scale)
+
+# endregion
+
+# region Jiggle Bone Operators
+
+
+class AddJiggleBoneOperator(bpy.types.Operator):
+    bl_idname = "source_procedural.jiggle_add"
+    bl_label = "Add Jiggle Bone"
+    bl_description = "Adds a new jiggle bone"
+
+    def execute(self, context):
+        source_procedural_bone_data = context.object.source_procedural_bone_data
+
+        source_procedural_bone_data.jiggle_bones.add()
+        source_procedural_bone_data.active_jiggle_bone = len(source_procedural_bone_data.jiggle_bones) - 1
+        clear_jiggle_bone_cache(context.object.name)
+
+        return {'FINISHED'}
+
+
+class RemoveJiggleBoneOperator(bpy.types.Operator):
+    bl_idname = "source_procedural.jiggle_remove"
+    bl_label = "Remove Jiggle Bone"
+    bl_description = "Removes the selected jiggle bone"
+
+    @classmethod
+    def poll(cls, context):
+        source_procedural_bone_data = context.object.source_procedural_bone_data
+
+        return len(source_procedural_bone_data.jiggle_bones) != 0
+
+    def execute(self, context):
+        source_procedural_bone_data = context.object.source_procedural_bone_data
+
+        source_procedural_bone_data.jiggle_bones.remove(source_procedural_bone_data.active_jiggle_bone)
+        clear_jiggle_bone_cache(context.object.name)
+
+        if source_procedural_bone_data.active_jiggle_bone > 0:
+            source_procedural_bone_data.active_jiggle_bone -= 1
+
+        return {'FINISHED'}
+
+
+class SimulateJiggleBonesOperator(ProceduralJobOperator, bpy.types.Operator):
+    bl_idname = "source_procedural.jiggle_simulate"
+    bl_label = "Simulate Jiggle Bones"
+    bl_description = "Simulates all jiggle bones over the scene frame range and caches the result. The simulated rotation replaces the jiggle bone's own rotation"
+
+    @classmethod
+    def poll(cls, context):
+        return not has_procedural_job(context) and len(get_jiggle_bones(context.object)) > 0
+
+    def execute(self, context):
+        job = ProceduralJob("Simulating jiggle bones")
+
+        return self.run_job(context, job, simulate_jiggle_bones(context.scene, context.object, job))
+
+
+class PreviewJiggleBonesOperator(bpy.types.Operator):
+    bl_idname = "source_procedural.jiggle_preview"
+    bl_label = "Preview Jiggle Bones"
+    bl_description = "Previews the cached jiggle bone simulation at the current frame. The simulated rotation replaces the jiggle bone's own rotation"
+
+    def __init__(self):
+        self.armature = None
+        self.timer = None
+
+    @classmethod
+    def poll(cls, context):
+        return len(get_jiggle_bones(context.object)) > 0
+
+    def execute(self, context):
+        source_procedural_bone_data = context.object.source_procedural_bone_data
+
+        if not source_procedural_bone_data.jiggle_preview:
+            source_procedural_bone_data.jiggle_preview = True
+            self.armature = context.object
+            self.timer = context.window_manager.event_timer_add(1/context.scene.render.fps, window=context.window)
+            context.window_manager.modal_handler_add(self)
+            return {'RUNNING_MODAL'}
+
+        source_procedural_bone_data.jiggle_preview = False
+        self.cancel(context)
+
+        return {'FINISHED'}
+
+    def modal(self, context, event):
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        armature = self.armature
+
+        if not armature.source_procedural_bone_data.jiggle_preview:
+            self.cancel(context)
+            return {'FINISHED'}
+
+        if len(get_jiggle_bones(armature)) == 0:
+            self.cancel(context)
+            return {'FINISHED'}
+
+        cache = get_jiggle_bone_cache(context.scene, armature)
+        if cache is None:
+            return {'PASS_THROUGH'}
+
+        apply_jiggle_bone_cache(armature, cache, context.scene.frame_current)
+
+        return {'PASS_THROUGH'}
+
+    def cancel(self, context):
+        if self.timer is not None:
+            context.window_manager.event_timer_remove(self.timer)
+            self.timer = None
+
+        if self.armature is not None:
+            self.armature.source_procedural_bone_data.jiggle_preview = False
+            self.armature = None
+
+
+class BakeJiggleBonesOperator(ProceduralJobOperator, bpy.types.Operator):
+    bl_idname = "source_procedural.jiggle_bake"
+    bl_label = "Bake Jiggle Bones"
+    bl_description = "Simulates all jiggle bones and keyframes their rotations into the active action"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return not has_procedural_job(context) and len(get_jiggle_bones(context.object)) > 0
+
+    def execute(self, context):
+        job = ProceduralJob("Baking jiggle bones")
+
+        return self.run_job(context, job, bake_jiggle_bones(context.scene, context.object, job))
+
+
+class CopyJiggleBoneOperator(bpy.types.Operator):
+    bl_idname = "source_procedural.jiggle_copy"
+    bl_label = "Copy Jiggle Bone"
+    bl_description = "Copies the selected jiggle bone to the clipboard"
+
+    @classmethod
+    def poll(cls, context):
+        source_procedural_bone_data = context.object.source_procedural_bone_data
+
+        if len(source_procedural_bone_data.jiggle_bones) == 0:
+            return False
+
+        active_jiggle_bone = source_procedural_bone_data.jiggle_bones[source_procedural_bone_data.active_jiggle_bone]
+
+        return context.object.pose.bones.get(active_jiggle_bone.bone) is not None
+
+    def execute(self, context):
+        source_procedural_bone_data = context.object.source_procedural_bone_data
+        active_jiggle_bone = source_procedural_bone_data.jiggle_bones[source_procedural_bone_data.active_jiggle_bone]
+
+        procedural_string = "$jigglebone \"" + get_string_after_dot(active_jiggle_bone.bone) + "\"\n{\n"
+        procedural_string += "\tis_flexible\n\t{\n"
+        procedural_string += "\t\tlength " + str(active_jiggle_bone.length) + "\n"
+        procedural_string += "\t\ttip_mass " + str(active_jiggle_bone.tip_mass) + "\n"
+        procedural_string += "\t\tpitch_stiffness " + str(active_jiggle_bone.pitch_stiffness) + "\n"
+        procedural_string += "\t\tpitch_damping " + str(active_jiggle_bone.pitch_damping) + "\n"
+        procedural_string += "\t\tyaw_stiffness " + str(active_jiggle_bone.yaw_stiffness) + "\n"
+        procedural_string += "\t\tyaw_damping " + str(active_jiggle_bone.yaw_damping) + "\n"
+
+        if active_jiggle_bone.pitch_constraint:
+            procedural_string += "\t\tpitch_constraint " + " ".join([str(degrees(r)) for r in active_jiggle_bone.pitch_limits]) + "\n"
+
+        if active_jiggle_bone.yaw_constraint:
+            procedural_string += "\t\tyaw_constraint " + " ".join([str(degrees(r)) for r in active_jiggle_bone.yaw_limits]) + "\n"
+
+        procedural_string += "\t}\n}\n"
+
+        context.window_manager.clipboard = procedural_string
+
+        return {'FINISHED'}
+
+# endregion
+
+# region MDL Import
+
+
+MDL_CONSTRAINT_TYPES = {
+    worker.STUDIO_PROC_POINT_CONSTRAINT: ('COPY_LOCATION', "Source Point Constraint"),
+    worker.STUDIO_PROC_ORIENT_CONSTRAINT: ('COPY_ROTATION', "Source Orient Constraint"),
+    worker.STUDIO_PROC_AIM_CONSTRAINT: ('DAMPED_TRACK', "Source Aim Constraint"),
+    worker.STUDIO_PROC_PARENT_CONSTRAINT: ('CHILD_OF', "Source Parent Constraint"),
+}
+
+
+def get_mdl_bone_lookup(armature):
+    lookup = {}
+
+    for pose_bone in armature.pose.bones:
+        lookup.setdefault(get_string_after_dot(pose_bone.name), pose_bone.name)
+
+    # Full names take priority over names after the dot.
+    for pose_bone in armature.pose.bones:
+        lookup[pose_bone.name] = pose_bone.name
+
+    return lookup
+
+
+def find_mdl_bone_names(lookup, bone_names):
+    if not all(bone_name in lookup for bone_name in bone_names):
+        return None
+
+    return {bone_name: lookup[bone_name] for bone_name in bone_names}
+
+
+def apply_mdl_procedurals(armature, matches, quaternion_procedurals, jiggle_bones, constraints):
+    source_procedural_bone_data = armature.source_procedural_bone_data
+    existing_quaternion_procedurals = {procedural.target_bone: procedural for procedural in source_procedural_bone_data.quaternion_procedurals}
+    existing_jiggle_bones = {jiggle_bone.bone: jiggle_bone for jiggle_bone in source_procedural_bone_data.jiggle_bones}
+
+    for target_name, control_name, triggers in quaternion_procedurals:
+        target_bone = matches[target_name]
+        procedural = existing_quaternion_procedurals.get(target_bone)
+
+        if procedural is None:
+            procedural = source_procedural_bone_data.quaternion_procedurals.add()
+            procedural.name = get_string_after_dot(target_bone)
+            procedural.target_bone = target_bone
+
+        # The compiled trigger positions already include the base position.
+        procedural.control_bone = matches[control_name]
+        procedural.override_position = True
+        procedural.position_override = (0, 0, 0)
+        procedural.distance = 0
+        procedural.triggers.clear()
+        procedural.active_trigger = 0
+
+        tolerances = 1 / np.maximum(triggers["inverse_tolerance"], 1e-6)
+        trigger_quaternions = triggers["trigger"][:, [3, 0, 1, 2]].tolist()
+        target_quaternions = triggers["quaternion"][:, [3, 0, 1, 2]].tolist()
+
+        for index in range(len(triggers)):
+            trigger = procedural.triggers.add()
+            trigger.name = "Trigger " + str(index + 1)
+            trigger.tolerance = tolerances[index]
+            trigger.trigger_angle = Quaternion(trigger_quaternions[index]).to_euler()
+            trigger.target_angle = Quaternion(target_quaternions[index]).to_euler()
+            trigger.target_position = triggers["position"][index].tolist()
+
+    for bone_name, values in jiggle_bones:
+        flags, length, tip_mass, yaw_stiffness, yaw_damping, pitch_stiffness, pitch_damping = values[:7]
+        min_yaw, max_yaw = values[10:12]
+        min_pitch, max_pitch = values[14:16]
+
+        bone = matches[bone_name]
+        jiggle_bone = existing_jiggle_bones.get(bone)
+
+        if jiggle_bone is None:
+            jiggle_bone = source_procedural_bone_data.jiggle_bones.add()
+            jiggle_bone.name = get_string_after_dot(bone)
+            jiggle_bone.bone = bone
+
+        jiggle_bone.length = length
+        jiggle_bone.tip_mass = tip_mass
+        jiggle_bone.yaw_stiffness = yaw_stiffness
+        jiggle_bone.yaw_damping = yaw_damping
+        jiggle_bone.pitch_stiffness = pitch_stiffness
+        jiggle_bone.pitch_damping = pitch_damping
+        jiggle_bone.yaw_constraint = bool(flags & worker.JIGGLE_HAS_YAW_CONSTRAINT)
+        jiggle_bone.yaw_limits = (min_yaw, max_yaw)
+        jiggle_bone.pitch_constraint = bool(flags & worker.JIGGLE_HAS_PITCH_CONSTRAINT)
+        jiggle_bone.pitch_limits = (min_pitch, max_pitch)
+
+    for procedural_type, bone_name, targets in constraints:
+        pose_bone = armature.pose.bones[matches[bone_name]]
+        constraint_type, constraint_name = MDL_CONSTRAINT_TYPES[procedural_type]
+
+        for constraint in [constraint for constraint in pose_bone.constraints if constraint.name.startswith(constraint_name)]:
+            pose_bone.constraints.remove(constraint)
+
+        # Each stacked constraint takes its share of the weight so far, which blends them into a weighted average.
+        total_weight = 0
+
+        for target_name, weight in targets:
+            total_weight += weight
+
+            constraint = pose_bone.constraints.new(constraint_type)
+            constraint.name = constraint_name
+            constraint.target = armature
+            constraint.subtarget = matches[target_name]
+            constraint.influence = weight / total_weight if total_weight > 0 else 0
+
+            if constraint_type == 'CHILD_OF':
+                constraint.set_inverse_pending = True
+
+    clear_jiggle_bone_cache(armature.name)
+
+
+def import_mdl_procedurals(armatures, filepaths, messages):
+    pool = get_worker_pool()
+    futures = {pool.submit(worker.load_mdl_procedurals, filepath): filepath for filepath in filepaths}
+    pending = set(futures)
+    lookups = {}
+    imported = 0
+    skipped = {}
+
+    try:
+        while pending:
+            done = [future for future in pending if future.done()]
+
+            if len(done) == 0:
+                yield None
+                continue
+
+            for future in done:
+                pending.remove(future)
+                filename = os.path.basename(futures[future])
+
+                try:
+                    quaternion_procedurals, jiggle_bones, constraints, skipped_procedurals = future.result()
+                except (OSError, ValueError, struct.error) as error:
+                    messages.append(('WARNING', filename + ": " + str(error)))
+                    continue
+
+                for name, count in skipped_procedurals.items():
+                    skipped[name] = skipped.get(name, 0) + count
+
+                bone_names = {name for procedural in quaternion_procedurals for name in procedural[:2]}
+                bone_names.update(jiggle_bone[0] for jiggle_bone in jiggle_bones)
+                for constraint in constraints:
+                    bone_names.add(constraint[1])
+                    bone_names.update(target[0] for target in constraint[2])
+
+                for armature in armatures:
+                    if armature.name not in lookups:
+                        lookups[armature.name] = get_mdl_bone_lookup(armature)
+
+                    matches = find_mdl_bone_names(lookups[armature.name], bone_names)
+                    if matches is not None:
+                        break
+                else:
+                    messages.append(('WARNING', filename + ": no armature has all of its procedural bones"))
+                    continue
+
+                apply_mdl_procedurals(armature, matches, quaternion_procedurals, jiggle_bones, constraints)
+                imported += len(quaternion_procedurals) + len(jiggle_bones) + len(constraints)
+
+                yield (len(filepaths) - len(pending)) / len(filepaths)
+    finally:
+        for future in pending:
+            future.cancel()
+
+    skipped_text = ", ".join(str(count) + " " + name for name, count in sorted(skipped.items()))
+    messages.append(('INFO', "Imported " + str(imported) + " procedurals" + (", skipped " + skipped_text if skipped_text else "")))
+
+
+class ImportMDLProceduralsOperator(ProceduralJobOperator, bpy.types.Operator, ImportHelper):
+    bl_idname = "source_procedural.import_mdl"
+    bl_label = "Import MDL Procedurals"
+    bl_description = "Imports quaternion procedurals, jiggle bones and constraints from compiled models onto matching armatures"
+
+    filename_ext = ".mdl"
+    filter_glob: bpy.props.StringProperty(default="*.mdl", options={'HIDDEN'})
+    files: bpy.props.CollectionProperty(type=bpy.types.OperatorFileListElement, options={'HIDDEN', 'SKIP_SAVE'})
+    directory: bpy.props.StringProperty(subtype='DIR_PATH', options={'HIDDEN', 'SKIP_SAVE'})
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'ARMATURE' and not has_procedural_job(context)
+
+    def execute(self, context):
+        filepaths = [os.path.join(self.directory, file.name) for file in self.files if file.name] or [self.filepath]
+
+        armatures = [context.object]
+        armatures += [obj for obj in context.scene.objects if obj.type == 'ARMATURE' and obj != context.object]
+
+        job = ProceduralJob("Importing MDL files")
+
+        return self.run_job(context, job, import_mdl_procedurals(armatures, filepaths, job.messages))
+
+# endregion
+
 # region UI
 
 
@@ -538,6 +1490,13 @@ class QuaternionProceduralTriggerList(bpy.types.UIList):
         layout.label(text=item.name)
 
 
+class JiggleBoneList(bpy.types.UIList):
+    bl_idname = "OBJECT_UL_JiggleBone"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
+        layout.label(text=item.name)
+
+
 class ProceduralBonePanel(bpy.types.Panel):
     bl_category = "Src Proc Bones"
     bl_label = "Quaternion Procedurals"
@@ -553,6 +1512,21 @@ class ProceduralBonePanel(bpy.types.Panel):
         layout = self.layout
         source_procedural_bone_data = context.object.source_procedural_bone_data
 
+        procedural_job = procedural_jobs.get(context.object.name)
+
+        if procedural_job is not None:
+            box = layout.box()
+            eta = procedural_job.get_eta()
+            box.progress(factor=procedural_job.progress, type='BAR',
+                         text=procedural_job.label + ("" if eta is None else " (" + str(round(eta)) + "s left)"))
+
+            row = box.row(align=True)
+            if procedural_job.paused:
+                row.operator(ResumeProceduralJobOperator.bl_idname, text="Resume", icon='PLAY')
+            else:
+                row.operator(PauseProceduralJobOperator.bl_idname, text="Pause", icon='PAUSE')
+            row.operator(CancelProceduralJobOperator.bl_idname, text="Cancel", icon='CANCEL')
+
         row = layout.row(align=True)
         row.template_list(QuaternionProceduralList.bl_idname, "", source_procedural_bone_data,
                           "quaternion_procedurals", source_procedural_bone_data, "active_quaternion_procedural")
@@ -561,6 +1535,10 @@ class ProceduralBonePanel(bpy.types.Panel):
         col.operator(AddQuaternionProceduralOperator.bl_idname, text="", icon='ADD')
         col.operator(RemoveQuaternionProceduralOperator.bl_idname, text="", icon='REMOVE')
 
+        row = layout.row(align=True)
+        row.operator(ImportMDLProceduralsOperator.bl_idname, text="Import From MDL", icon='IMPORT')
+        row.operator(CopyAllQuaternionProceduralsOperator.bl_idname, text="Copy All", icon='COPYDOWN')
+
         if len(source_procedural_bone_data.quaternion_procedurals) == 0:
             return
 
@@ -640,6 +1618,96 @@ class ProceduralBonePanel(bpy.types.Panel):
 
         col.operator(PreviewQuaternionProceduralTriggerOperator.bl_idname, text="Preview Trigger")
 
+
+class JiggleBonePanel(bpy.types.Panel):
+    bl_category = "Src Proc Bones"
+    bl_label = "Jiggle Bones"
+    bl_idname = "VIEW3D_PT_JiggleBone"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'ARMATURE'
+
+    def draw(self, context):
+        layout = self.layout
+        source_procedural_bone_data = context.object.source_procedural_bone_data
+
+        row = layout.row(align=True)
+        row.template_list(JiggleBoneList.bl_idname, "", source_procedural_bone_data,
+                          "jiggle_bones", source_procedural_bone_data, "active_jiggle_bone")
+
+        col = row.column(align=True)
+        col.operator(AddJiggleBoneOperator.bl_idname, text="", icon='ADD')
+        col.operator(RemoveJiggleBoneOperator.bl_idname, text="", icon='REMOVE')
+
+        col = layout.column(align=True)
+        col.prop(source_procedural_bone_data, "jiggle_substeps", text="Substeps")
+        col.operator(SimulateJiggleBonesOperator.bl_idname, text="Simulate")
+        col.operator(PreviewJiggleBonesOperator.bl_idname, text="Preview Jiggle Bones", depress=source_procedural_bone_data.jiggle_preview)
+        col.operator(BakeJiggleBonesOperator.bl_idname, text="Bake To Action")
+
+        if len(source_procedural_bone_data.jiggle_bones) == 0:
+            return
+
+        active_jiggle_bone = source_procedural_bone_data.jiggle_bones[source_procedural_bone_data.active_jiggle_bone]
+
+        col = layout.column(align=True)
+        col.prop(active_jiggle_bone, "name", text="")
+
+        box = col.box()
+        row = box.row(align=True)
+        row.label(text="Bone:")
+        row.prop_search(active_jiggle_bone, "bone", context.object.pose, "bones", text="")
+
+        if context.object.pose.bones.get(active_jiggle_bone.bone) is None:
+            return
+
+        col = box.column(align=True)
+        col.prop(active_jiggle_bone, "length", text="Length")
+        col.prop(active_jiggle_bone, "tip_mass", text="Tip Mass")
+
+        row = col.row(align=True)
+        row.prop(active_jiggle_bone, "yaw_stiffness", text="Yaw Stiffness")
+        row.prop(active_jiggle_bone, "yaw_damping", text="Yaw Damping")
+
+        row = col.row(align=True)
+        row.prop(active_jiggle_bone, "pitch_stiffness", text="Pitch Stiffness")
+        row.prop(active_jiggle_bone, "pitch_damping", text="Pitch Damping")
+
+        row = col.row(align=True)
+        row.prop(active_jiggle_bone, "yaw_constraint", text="Yaw Constraint")
+        if active_jiggle_bone.yaw_constraint:
+            row.prop(active_jiggle_bone, "yaw_limits", text="")
+
+        row = col.row(align=True)
+        row.prop(active_jiggle_bone, "pitch_constraint", text="Pitch Constraint")
+        if active_jiggle_bone.pitch_constraint:
+            row.prop(active_jiggle_bone, "pitch_limits", text="")
+
+        box.operator(CopyJiggleBoneOperator.bl_idname, text="Copy Jiggle Bone")
+
+# endregion
+
+# region Handlers
+
+
+@persistent
+def clear_procedural_state(dummy):
+    jiggle_bone_caches.clear()
+    jiggle_bone_generations.clear()
+
+    # Runners are cancelled with the old file and only pause their job, so the jobs are dropped here.
+    for procedural_job in procedural_jobs.values():
+        try:
+            procedural_job.cancel()
+        except ReferenceError:
+            pass
+
+    procedural_jobs.clear()
+    shutdown_worker_pool()
+
 # endregion
 
 
@@ -647,13 +1715,20 @@ def register():
     # Properties
     bpy.utils.register_class(QuaternionProceduralTriggerProperty)
     bpy.utils.register_class(QuaternionProceduralProperty)
+    bpy.utils.register_class(JiggleBoneProperty)
     bpy.utils.register_class(SourceProceduralBoneDataProperty)
 
+    # Job Operators
+    bpy.utils.register_class(PauseProceduralJobOperator)
+    bpy.utils.register_class(ResumeProceduralJobOperator)
+    bpy.utils.register_class(CancelProceduralJobOperator)
+
     # Quaternion Procedural Operators
     bpy.utils.register_class(AddQuaternionProceduralOperator)
     bpy.utils.register_class(RemoveQuaternionProceduralOperator)
     bpy.utils.register_class(PreviewQuaternionProceduralOperator)
     bpy.utils.register_class(CopyQuaternionProceduralOperator)
+    bpy.utils.register_class(CopyAllQuaternionProceduralsOperator)
 
     # Quaternion Procedural Trigger Operators
     bpy.utils.register_class(AddQuaternionProceduralTriggerOperator)
@@ -665,25 +1740,47 @@ def register():
     bpy.utils.register_class(SetPositionQuaternionProceduralTriggerOperator)
     bpy.utils.register_class(PreviewQuaternionProceduralTriggerOperator)
 
+    # Jiggle Bone Operators
+    bpy.utils.register_class(AddJiggleBoneOperator)
+    bpy.utils.register_class(RemoveJiggleBoneOperator)
+    bpy.utils.register_class(SimulateJiggleBonesOperator)
+    bpy.utils.register_class(PreviewJiggleBonesOperator)
+    bpy.utils.register_class(BakeJiggleBonesOperator)
+    bpy.utils.register_class(CopyJiggleBoneOperator)
+
+    # MDL Import
+    bpy.utils.register_class(ImportMDLProceduralsOperator)
+
     # UI
     bpy.utils.register_class(QuaternionProceduralList)
     bpy.utils.register_class(QuaternionProceduralTriggerList)
+    bpy.utils.register_class(JiggleBoneList)
     bpy.utils.register_class(ProceduralBonePanel)
+    bpy.utils.register_class(JiggleBonePanel)
 
     bpy.types.Object.source_procedural_bone_data = bpy.props.PointerProperty(type=SourceProceduralBoneDataProperty)
 
+    bpy.app.handlers.load_post.append(clear_procedural_state)
+
 
 def unregister():
     # Properties
     bpy.utils.unregister_class(QuaternionProceduralTriggerProperty)
     bpy.utils.unregister_class(QuaternionProceduralProperty)
+    bpy.utils.unregister_class(JiggleBoneProperty)
     bpy.utils.unregister_class(SourceProceduralBoneDataProperty)
 
+    # Job Operators
+    bpy.utils.unregister_class(PauseProceduralJobOperator)
+    bpy.utils.unregister_class(ResumeProceduralJobOperator)
+    bpy.utils.unregister_class(CancelProceduralJobOperator)
+
     # Quaternion Procedural Operators
     bpy.utils.unregister_class(AddQuaternionProceduralOperator)
     bpy.utils.unregister_class(RemoveQuaternionProceduralOperator)
     bpy.utils.unregister_class(PreviewQuaternionProceduralOperator)
     bpy.utils.unregister_class(CopyQuaternionProceduralOperator)
+    bpy.utils.unregister_class(CopyAllQuaternionProceduralsOperator)
 
     # Quaternion Procedural Trigger Operators
     bpy.utils.unregister_class(AddQuaternionProceduralTriggerOperator)
@@ -695,9 +1792,30 @@ def unregister():
     bpy.utils.unregister_class(SetPositionQuaternionProceduralTriggerOperator)
     bpy.utils.unregister_class(PreviewQuaternionProceduralTriggerOperator)
 
+    # Jiggle Bone Operators
+    bpy.utils.unregister_class(AddJiggleBoneOperator)
+    bpy.utils.unregister_class(RemoveJiggleBoneOperator)
+    bpy.utils.unregister_class(SimulateJiggleBonesOperator)
+    bpy.utils.unregister_class(PreviewJiggleBonesOperator)
+    bpy.utils.unregister_class(BakeJiggleBonesOperator)
+    bpy.utils.unregister_class(CopyJiggleBoneOperator)
+
+    # MDL Import
+    bpy.utils.unregister_class(ImportMDLProceduralsOperator)
+
     # UI
     bpy.utils.unregister_class(QuaternionProceduralList)
     bpy.utils.unregister_class(QuaternionProceduralTriggerList)
+    bpy.utils.unregister_class(JiggleBoneList)
     bpy.utils.unregister_class(ProceduralBonePanel)
+    bpy.utils.unregister_class(JiggleBonePanel)
 
     del bpy.types.Object.source_procedural_bone_data
+
+    bpy.app.handlers.load_post.remove(clear_procedural_state)
+
+    for procedural_job in procedural_jobs.values():
+        procedural_job.cancel()
+
+    procedural_jobs.clear()
+    shutdown_worker_pool()
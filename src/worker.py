@@ -0,0 +1,333 @@
+import mmap
+import numpy as np
+import struct
+from math import radians
+
+# Everything here runs in worker processes, which can not import bpy.
+
+# region Jiggle Bone Integration
+
+
+def dot_rows(a, b):
+    return np.einsum('ij,ij->i', a, b)
+
+
+def quaternions_to_matrices(quaternions):
+    w, x, y, z = quaternions.T
+    matrices = np.zeros((len(quaternions), 4, 4))
+
+    matrices[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    matrices[:, 0, 1] = 2 * (x * y - w * z)
+    matrices[:, 0, 2] = 2 * (x * z + w * y)
+    matrices[:, 1, 0] = 2 * (x * y + w * z)
+    matrices[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    matrices[:, 1, 2] = 2 * (y * z - w * x)
+    matrices[:, 2, 0] = 2 * (x * z - w * y)
+    matrices[:, 2, 1] = 2 * (y * z + w * x)
+    matrices[:, 2, 2] = 1 - 2 * (x * x + y * y)
+    matrices[:, 3, 3] = 1
+
+    return matrices
+
+
+# The bone's Y axis is the jiggle direction, yaw swings the tip along the bone's X axis and pitch along its Z axis.
+class JiggleBoneIntegrator:
+    def __init__(self, levels, parent_indices, rest_offsets, lengths, tip_masses, yaw_stiffnesses, yaw_dampings,
+                 pitch_stiffnesses, pitch_dampings, yaw_minimums, yaw_maximums, pitch_minimums, pitch_maximums):
+        self.levels = levels
+        self.parent_indices = parent_indices
+        self.rest_offsets = rest_offsets
+        self.lengths = lengths
+        self.tip_masses = tip_masses
+        self.yaw_stiffnesses = yaw_stiffnesses
+        self.yaw_dampings = yaw_dampings
+        self.pitch_stiffnesses = pitch_stiffnesses
+        self.pitch_dampings = pitch_dampings
+        self.yaw_minimums = yaw_minimums
+        self.yaw_maximums = yaw_maximums
+        self.pitch_minimums = pitch_minimums
+        self.pitch_maximums = pitch_maximums
+        self.tip_positions = np.zeros((len(lengths), 3))
+        self.tip_velocities = np.zeros((len(lengths), 3))
+
+    def reset(self, goals):
+        axes = goals[:, :3, :3] / np.linalg.norm(goals[:, :3, :3], axis=1, keepdims=True)
+        self.tip_positions = goals[:, :3, 3] + axes[:, :, 1] * self.lengths[:, None]
+        self.tip_velocities = np.zeros_like(self.tip_positions)
+
+    def step(self, indices, goals, delta_time):
+        axes = goals[:, :3, :3] / np.linalg.norm(goals[:, :3, :3], axis=1, keepdims=True)
+        left, forward, up = axes[:, :, 0], axes[:, :, 1], axes[:, :, 2]
+        base = goals[:, :3, 3]
+        lengths = self.lengths[indices][:, None]
+
+        tip = self.tip_positions[indices]
+        velocity = self.tip_velocities[indices]
+        error = tip - (base + forward * lengths)
+
+        yaw_acceleration = -self.yaw_stiffnesses[indices] * dot_rows(error, left) - self.yaw_dampings[indices] * dot_rows(velocity, left)
+        pitch_acceleration = -self.pitch_stiffnesses[indices] * dot_rows(error, up) - self.pitch_dampings[indices] * dot_rows(velocity, up)
+
+        acceleration = yaw_acceleration[:, None] * left + pitch_acceleration[:, None] * up
+        acceleration[:, 2] -= self.tip_masses[indices]
+
+        velocity = velocity + acceleration * delta_time
+        tip = tip + velocity * delta_time
+
+        direction = tip - base
+        x = dot_rows(direction, left)
+        y = dot_rows(direction, forward)
+        z = dot_rows(direction, up)
+
+        yaw = np.arctan2(x, y)
+        pitch = np.arctan2(z, y)
+        clamped_yaw = np.clip(yaw, self.yaw_minimums[indices], self.yaw_maximums[indices])
+        clamped_pitch = np.clip(pitch, self.pitch_minimums[indices], self.pitch_maximums[indices])
+        yaw_clamped = clamped_yaw != yaw
+        pitch_clamped = clamped_pitch != pitch
+        constrained = yaw_clamped | pitch_clamped
+
+        limit = radians(89)
+        x = np.where(constrained, np.tan(np.clip(clamped_yaw, -limit, limit)), x)
+        y = np.where(constrained, 1, y)
+        z = np.where(constrained, np.tan(np.clip(clamped_pitch, -limit, limit)), z)
+
+        local_direction = np.stack((x, y, z), axis=1)
+        norm = np.linalg.norm(local_direction, axis=1, keepdims=True)
+        local_direction = np.where(norm > 1e-9, local_direction / np.maximum(norm, 1e-9), (0, 1, 0))
+        x, y, z = local_direction.T
+
+        direction = left * x[:, None] + forward * y[:, None] + up * z[:, None]
+        tip = base + direction * lengths
+
+        # The tip stays at a fixed length, so only keep the velocity that swings it.
+        velocity -= dot_rows(velocity, direction)[:, None] * direction
+        velocity -= np.where(yaw_clamped, dot_rows(velocity, left), 0)[:, None] * left
+        velocity -= np.where(pitch_clamped, dot_rows(velocity, up), 0)[:, None] * up
+
+        self.tip_positions[indices] = tip
+        self.tip_velocities[indices] = velocity
+
+        # Shortest arc from the bone's Y axis to the tip direction, as (w, x, y, z).
+        quaternions = np.stack((1 + y, z, np.zeros_like(y), -x), axis=1)
+        norm = np.linalg.norm(quaternions, axis=1, keepdims=True)
+
+        return np.where(norm > 1e-6, quaternions / np.maximum(norm, 1e-6), (0, 0, 0, 1))
+
+    def integrate(self, anchors, delta_time, substeps):
+        frame_count, bone_count = anchors.shape[:2]
+        roots = self.parent_indices < 0
+        rotations = np.zeros((frame_count, bone_count, 4))
+        rotations[..., 0] = 1
+
+        if frame_count == 0 or bone_count == 0:
+            return rotations
+
+        goals = anchors[0].copy()
+        world = goals.copy()
+
+        for indices in self.levels[1:]:
+            goals[indices] = world[self.parent_indices[indices]] @ self.rest_offsets[indices]
+            world[indices] = goals[indices]
+
+        self.reset(goals)
+
+        for frame_index in range(1, frame_count):
+            for substep in range(1, substeps + 1):
+                factor = substep / substeps
+                goals[roots] = anchors[frame_index - 1, roots] * (1 - factor) + anchors[frame_index, roots] * factor
+
+                for level, indices in enumerate(self.levels):
+                    if level > 0:
+                        goals[indices] = world[self.parent_indices[indices]] @ self.rest_offsets[indices]
+
+                    quaternions = self.step(indices, goals[indices], delta_time)
+                    world[indices] = goals[indices] @ quaternions_to_matrices(quaternions)
+                    rotations[frame_index, indices] = quaternions
+
+        return rotations
+
+
+
+def integrate_jiggle_bones(parameters, anchors, delta_time, substeps):
+    return JiggleBoneIntegrator(**parameters).integrate(anchors, delta_time, substeps)
+
+# endregion
+
+# region MDL Parsing
+
+
+STUDIO_PROC_QUATINTERP = 2
+STUDIO_PROC_JIGGLE = 5
+STUDIO_PROC_POINT_CONSTRAINT = 8
+STUDIO_PROC_ORIENT_CONSTRAINT = 9
+STUDIO_PROC_AIM_CONSTRAINT = 10
+STUDIO_PROC_PARENT_CONSTRAINT = 12
+
+STUDIO_PROC_CONSTRAINTS = (STUDIO_PROC_POINT_CONSTRAINT, STUDIO_PROC_ORIENT_CONSTRAINT, STUDIO_PROC_AIM_CONSTRAINT, STUDIO_PROC_PARENT_CONSTRAINT)
+
+STUDIO_PROC_NAMES = {
+    1: "axis interp",
+    2: "quaternion interp",
+    3: "aim at bone",
+    4: "aim at attachment",
+    5: "jiggle",
+    6: "twist master",
+    7: "twist slave",
+    8: "point constraint",
+    9: "orient constraint",
+    10: "aim constraint",
+    11: "ik constraint",
+    12: "parent constraint",
+    13: "softbody",
+}
+
+JIGGLE_IS_FLEXIBLE = 0x01
+JIGGLE_HAS_YAW_CONSTRAINT = 0x04
+JIGGLE_HAS_PITCH_CONSTRAINT = 0x08
+
+MAX_QUATERNION_TRIGGERS = 32
+
+MDL_BONE_DTYPE = np.dtype([
+    ("name_offset", "<i4"),
+    ("parent", "<i4"),
+    ("bone_controller", "<i4", 6),
+    ("position", "<f4", 3),
+    ("quaternion", "<f4", 4),
+    ("rotation", "<f4", 3),
+    ("position_scale", "<f4", 3),
+    ("rotation_scale", "<f4", 3),
+    ("pose_to_bone", "<f4", (3, 4)),
+    ("alignment", "<f4", 4),
+    ("flags", "<i4"),
+    ("procedural_type", "<i4"),
+    ("procedural_offset", "<i4"),
+    ("physics_bone", "<i4"),
+    ("surface_property_offset", "<i4"),
+    ("contents", "<i4"),
+    ("unused", "<i4", 8),
+])
+
+MDL_QUATERNION_TRIGGER_DTYPE = np.dtype([
+    ("inverse_tolerance", "<f4"),
+    ("trigger", "<f4", 4),
+    ("position", "<f4", 3),
+    ("quaternion", "<f4", 4),
+])
+
+# bone, weight, position offset and orientation offset.
+MDL_CONSTRAINT_TARGET_DTYPE = np.dtype([
+    ("bone", "<i4"),
+    ("weight", "<f4"),
+    ("position", "<f4", 3),
+    ("quaternion", "<f4", 4),
+])
+
+# flags, length, tip_mass, yaw stiffness and damping, pitch stiffness and damping, along stiffness and damping,
+# angle limit, yaw min, max, friction and bounce, pitch min, max, friction and bounce.
+MDL_JIGGLE_BONE_FORMAT = "<i17f"
+
+
+def check_mdl_offset(data, offset):
+    if not 0 <= offset < len(data):
+        raise ValueError("offset " + str(offset) + " is out of range")
+
+    return offset
+
+
+def read_mdl_string(data, offset):
+    end = data.find(b"\0", check_mdl_offset(data, offset))
+    if end < 0:
+        raise ValueError("string at offset " + str(offset) + " is not terminated")
+
+    return data[offset:end].decode("ascii", errors="replace")
+
+
+def read_mdl_procedurals(data):
+    if data[0:4] != b"IDST":
+        raise ValueError("not a Source model")
+
+    version, = struct.unpack_from("<i", data, 4)
+    if not 44 <= version <= 49:
+        raise ValueError("unsupported model version " + str(version))
+
+    bone_count, bone_offset = struct.unpack_from("<2i", data, 156)
+    if bone_count < 0:
+        raise ValueError("invalid bone count " + str(bone_count))
+
+    if bone_count > 0:
+        check_mdl_offset(data, bone_offset)
+
+    bones = np.frombuffer(data, dtype=MDL_BONE_DTYPE, count=bone_count, offset=bone_offset)
+
+    bone_names = {}
+
+    def get_bone_name(bone_index):
+        if not 0 <= bone_index < bone_count:
+            raise ValueError("bone index " + str(bone_index) + " is out of range")
+
+        if bone_index not in bone_names:
+            bone_start = bone_offset + bone_index * MDL_BONE_DTYPE.itemsize
+            bone_names[bone_index] = read_mdl_string(data, bone_start + int(bones["name_offset"][bone_index]))
+        return bone_names[bone_index]
+
+    def read_array(dtype, count, offset):
+        if count < 0:
+            raise ValueError("invalid count " + str(count))
+
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+
+        return np.frombuffer(data, dtype=dtype, count=count, offset=check_mdl_offset(data, offset)).copy()
+
+    quaternion_procedurals = []
+    jiggle_bones = []
+    constraints = []
+    skipped = {}
+
+    procedural_types = bones["procedural_type"]
+
+    for bone_index in np.flatnonzero(procedural_types != 0):
+        bone_index = int(bone_index)
+        procedural_type = int(procedural_types[bone_index])
+        procedural_start = check_mdl_offset(data, bone_offset + bone_index * MDL_BONE_DTYPE.itemsize + int(bones["procedural_offset"][bone_index]))
+
+        if procedural_type == STUDIO_PROC_QUATINTERP:
+            control, trigger_count, trigger_offset = struct.unpack_from("<3i", data, procedural_start)
+
+            # Blender only drives up to the first 32 triggers of a quaternion procedural.
+            if trigger_count > MAX_QUATERNION_TRIGGERS:
+                skipped["trigger over 32"] = skipped.get("trigger over 32", 0) + trigger_count - MAX_QUATERNION_TRIGGERS
+                trigger_count = MAX_QUATERNION_TRIGGERS
+
+            triggers = read_array(MDL_QUATERNION_TRIGGER_DTYPE, trigger_count, procedural_start + trigger_offset)
+            quaternion_procedurals.append((get_bone_name(bone_index), get_bone_name(control), triggers))
+        elif procedural_type == STUDIO_PROC_JIGGLE:
+            values = struct.unpack_from(MDL_JIGGLE_BONE_FORMAT, data, procedural_start)
+
+            if not values[0] & JIGGLE_IS_FLEXIBLE:
+                skipped["rigid jiggle"] = skipped.get("rigid jiggle", 0) + 1
+                continue
+
+            jiggle_bones.append((get_bone_name(bone_index), values))
+        elif procedural_type in STUDIO_PROC_CONSTRAINTS:
+            # target offset and count, then the slave bone with its base position and orientation.
+            target_offset, target_count, slave = struct.unpack_from("<3i", data, procedural_start)
+            targets = read_array(MDL_CONSTRAINT_TARGET_DTYPE, target_count, procedural_start + target_offset)
+            constraints.append((procedural_type, get_bone_name(slave),
+                                [(get_bone_name(int(target["bone"])), float(target["weight"])) for target in targets]))
+        else:
+            name = STUDIO_PROC_NAMES.get(procedural_type, "type " + str(procedural_type))
+            skipped[name] = skipped.get(name, 0) + 1
+
+    return quaternion_procedurals, jiggle_bones, constraints, skipped
+
+
+def load_mdl_procedurals(filepath):
+    # The bone table is read through views of the mapping, so it is left to unmap once they are released.
+    with open(filepath, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return read_mdl_procedurals(data)
+
+# endregion